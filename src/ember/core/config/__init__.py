@@ -38,7 +38,7 @@ config_manager.set_provider_api_key("openai", "sk-your-key")
 """
 
 from .schema import EmberConfig, Provider, Model, Cost, RegistryConfig, LoggingConfig
-from .loader import load_config, merge_dicts, resolve_env_vars
+from .loader import load_config, load_config_data, merge_dicts, resolve_env_vars
 from .manager import ConfigManager, create_config_manager
 from .exceptions import ConfigError
 
@@ -52,6 +52,7 @@ __all__ = [
     "LoggingConfig",
     # Loader functions
     "load_config",
+    "load_config_data",
     "merge_dicts",
     "resolve_env_vars",
     # Manager classes
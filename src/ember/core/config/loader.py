@@ -207,6 +207,41 @@ def load_from_env(prefix: str = "EMBER") -> Dict[str, Any]:
     return result
 
 
+def load_config_data(
+    file_path: Optional[str] = None, env_prefix: str = "EMBER"
+) -> Dict[str, Any]:
+    """Load raw configuration data from file and environment without validation.
+
+    Args:
+        file_path: Path to config file (defaults to EMBER_CONFIG from env or "config.yaml")
+        env_prefix: Prefix for environment variables
+
+    Returns:
+        Merged configuration dictionary with environment variables resolved
+
+    Raises:
+        ConfigError: If the configuration file cannot be read or parsed
+    """
+    # Determine config path
+    path = file_path or os.environ.get(f"{env_prefix}_CONFIG", "config.yaml")
+
+    # Start with default empty config
+    config_data: Dict[str, Any] = {}
+
+    # Load from file if it exists
+    if os.path.exists(path):
+        file_config = load_yaml_file(path)
+        config_data = merge_dicts(config_data, file_config)
+
+    # Load from environment (overrides file)
+    env_config = load_from_env(env_prefix)
+    if env_config:
+        config_data = merge_dicts(config_data, env_config)
+
+    # Resolve environment variables in strings
+    return resolve_env_vars(config_data)
+
+
 def load_config(
     file_path: Optional[str] = None, env_prefix: str = "EMBER"
 ) -> EmberConfig:
@@ -223,24 +258,7 @@ def load_config(
         ConfigError: On loading or validation failure
     """
     try:
-        # Determine config path
-        path = file_path or os.environ.get(f"{env_prefix}_CONFIG", "config.yaml")
-
-        # Start with default empty config
-        config_data: Dict[str, Any] = {}
-
-        # Load from file if it exists
-        if os.path.exists(path):
-            file_config = load_yaml_file(path)
-            config_data = merge_dicts(config_data, file_config)
-
-        # Load from environment (overrides file)
-        env_config = load_from_env(env_prefix)
-        if env_config:
-            config_data = merge_dicts(config_data, env_config)
-
-        # Resolve environment variables in strings
-        config_data = resolve_env_vars(config_data)
+        config_data = load_config_data(file_path=file_path, env_prefix=env_prefix)
 
         # Create and validate config object
         return EmberConfig.model_validate(config_data)
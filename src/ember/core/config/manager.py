@@ -4,16 +4,231 @@ This module provides a simple configuration management system for the Ember fram
 It handles loading, validating, and accessing configuration values.
 """
 
+import copy
 import logging
 import os
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from threading import RLock
-from typing import Any, Dict, Optional
+from threading import Lock
+from typing import Any, Dict, Iterable, Iterator, Optional, Tuple
 
-from .schema import EmberConfig
-from .loader import load_config
+from pydantic import BaseModel
+
+from .schema import EmberConfig, Provider
+from .loader import load_config_data
 from .exceptions import ConfigError
 
+# Used when no logger is injected; looked up once rather than per instance
+_DEFAULT_LOGGER = logging.getLogger(__name__)
+
+# Marks a (section, key) lookup that resolved to nothing
+_MISSING = object()
+
+
+def _lookup(obj: Any, name: str) -> Any:
+    """
+    Resolve an attribute of a configuration object.
+
+    Pydantic fields and extras are read straight from the model's storage
+    dicts; anything else (methods, properties, non-model values) falls back to
+    a single getattr instead of a hasattr/getattr pair.
+
+    Args:
+        obj: Configuration object (usually a Pydantic model)
+        name: Attribute name
+
+    Returns:
+        Attribute value, or _MISSING if it does not exist
+    """
+    if isinstance(obj, BaseModel):
+        if name in type(obj).model_fields:
+            return obj.__dict__[name]
+        extra = obj.__pydantic_extra__
+        if extra and name in extra:
+            return extra[name]
+    try:
+        return getattr(obj, name, _MISSING)
+    except TypeError:
+        return _MISSING
+
+
+def _model_items(model: BaseModel) -> Iterator[Tuple[str, Any]]:
+    """Yield a model's (name, value) pairs for its fields and extras."""
+    for name in type(model).model_fields:
+        yield name, model.__dict__[name]
+    if model.__pydantic_extra__:
+        yield from model.__pydantic_extra__.items()
+
+
+def _flatten(config: EmberConfig) -> Dict[Tuple[str, str], Any]:
+    """
+    Map every (section, key) pair of a validated config to its value.
+
+    Values are the model objects themselves (not a model_dump), so get()
+    returns the same types whether or not the flat map has been built.
+
+    Args:
+        config: Validated configuration
+
+    Returns:
+        Flat mapping from (section, key) to value
+    """
+    return {
+        (section, key): value
+        for section, section_obj in _model_items(config)
+        if isinstance(section_obj, BaseModel)
+        for key, value in _model_items(section_obj)
+    }
+
+
+def _validate(data: Dict[str, Any]) -> EmberConfig:
+    """
+    Validate raw configuration data into an EmberConfig.
+
+    Args:
+        data: Raw configuration dictionary
+
+    Returns:
+        Validated EmberConfig instance
+
+    Raises:
+        ConfigError: On validation failure
+    """
+    try:
+        return EmberConfig.model_validate(data)
+    except Exception as e:
+        raise ConfigError(f"Failed to load configuration: {e}")
+
+
+class _ConfigSnapshot:
+    """
+    Immutable view of one loaded configuration.
+
+    Holds the raw merged configuration data and validates it lazily: a single
+    section is validated the first time it is read through section(), and the
+    full EmberConfig is only built when config() is called. Once built, the
+    full config is authoritative for section reads as well.
+
+    Resolved (section, key) lookups are memoized as well, so repeated get()
+    calls skip the attribute walk. Once the full config exists, every section
+    field is precomputed into that memo, so even first reads are a single dict
+    probe. Lazily built values are only ever added or replaced by their
+    full-config equivalents, so concurrent readers at worst compute the same
+    value twice.
+    """
+
+    __slots__ = ("_raw", "_sections", "_config", "_values")
+
+    def __init__(
+        self,
+        raw: Optional[Dict[str, Any]] = None,
+        config: Optional[EmberConfig] = None,
+    ) -> None:
+        self._raw = raw if raw is not None else {}
+        self._sections: Dict[str, Any] = {}
+        self._config = config
+        self._values: Dict[Tuple[str, str], Any] = (
+            _flatten(config) if config is not None else {}
+        )
+
+    def config(self) -> EmberConfig:
+        """
+        Get the fully validated configuration.
+
+        Returns:
+            Validated EmberConfig instance
+
+        Raises:
+            ConfigError: On validation failure
+        """
+        config = self._config
+        if config is None:
+            config = _validate(self._raw)
+            self._values.update(_flatten(config))
+            self._config = config
+        return config
+
+    def owned_config(self) -> EmberConfig:
+        """
+        Get a fully validated configuration the caller may modify.
+
+        Unlike config(), this does not build or memoize anything on the
+        snapshot, so it leaves what section() and value() serve unchanged.
+
+        Returns:
+            EmberConfig instance that shares no state with this snapshot
+
+        Raises:
+            ConfigError: On validation failure
+        """
+        config = self._config
+        if config is not None:
+            return config.model_copy(deep=True)
+        return _validate(copy.deepcopy(self._raw))
+
+    def section(self, name: str) -> Any:
+        """
+        Get a single top-level section, validating only that section.
+
+        Args:
+            name: Section name (e.g., "registry" or "logging")
+
+        Returns:
+            Validated section value, or None if the section does not exist
+
+        Raises:
+            ConfigError: If the section fails validation
+        """
+        config = self._config
+        if config is not None:
+            value = _lookup(config, name)
+            return None if value is _MISSING else value
+        try:
+            return self._sections[name]
+        except KeyError:
+            pass
+        data = {name: self._raw[name]} if name in self._raw else {}
+        value = _lookup(_validate(data), name)
+        value = None if value is _MISSING else value
+        self._sections[name] = value
+        return value
+
+    def value(self, section: str, key: str) -> Any:
+        """
+        Get the value of a key within a section.
+
+        Args:
+            section: Section name
+            key: Key within the section
+
+        Returns:
+            Configuration value, or _MISSING if the section or key does not exist
+
+        Raises:
+            ConfigError: If the section fails validation
+        """
+        try:
+            return self._values[(section, key)]
+        except KeyError:
+            pass
+        except TypeError:
+            return _MISSING
+
+        section_obj = self.section(section)
+        value = _MISSING if section_obj is None else _lookup(section_obj, key)
+        self._values[(section, key)] = value
+        return value
+
+
+# Loaded snapshots keyed by abspath, each stored with the
+# (st_mtime_ns, st_size, env fingerprint) stamp it was loaded under. Snapshots
+# are immutable, so manager instances for an unchanged file share one and skip
+# both YAML parsing and any validation another instance already did. Keeping
+# one entry per path means a changed file replaces its stale snapshot instead
+# of accumulating a new one per modification.
+_CONFIG_CACHE: Dict[str, Tuple[Tuple[Any, ...], _ConfigSnapshot]] = {}
+_CONFIG_CACHE_LOCK = Lock()
+
 
 class ConfigManager:
     """
@@ -21,6 +236,18 @@ class ConfigManager:
 
     This class handles loading, reloading, and accessing configuration values.
     It provides thread-safe access to configuration and manages API keys.
+    The current configuration is published as an immutable snapshot: readers
+    load ``self._snapshot`` once and never take a lock, while writers build a
+    new snapshot under the lock and swap the reference in a single
+    attribute assignment. Callers of get_config() must therefore treat the
+    returned EmberConfig as read-only.
+
+    reload_async() revalidates in the background while readers keep being
+    served the last known-good snapshot (stale-while-revalidate).
+
+    Construction only reads the configuration sources. Validation is deferred
+    until a section is first read through get(), or until get_config() needs
+    the full EmberConfig, so validation errors surface on first access.
     """
 
     def __init__(
@@ -33,51 +260,217 @@ class ConfigManager:
             config_path: Path to configuration file
             logger: Logger for configuration events
         """
-        self._lock = RLock()
-        self._logger = logger or logging.getLogger(self.__class__.__name__)
+        self._lock = Lock()
+        self._logger = logger or _DEFAULT_LOGGER
         self._config_path = config_path
-        self._config = self.load()
+        # Normalized once so loads and cache lookups skip path handling. The
+        # path is made absolute but symlinks are deliberately not resolved, so
+        # a config swapped in by re-pointing a symlink is still picked up.
+        self._resolved_path: Optional[str] = (
+            str(Path(os.fspath(config_path)).absolute()) if config_path else None
+        )
+        # Created on the first reload_async() call and released by close()
+        self._reload_executor: Optional[ThreadPoolExecutor] = None
+        self._snapshot = self._load_snapshot()
 
     def load(self) -> EmberConfig:
         """
         Load configuration from file and environment.
 
+        The current snapshot is left untouched and no lock is taken: the
+        sources are only read, and the shared cache has its own lock. The
+        cached snapshot is shared across managers, so the caller gets its own
+        copy, and a snapshot that has not been fully validated yet is not
+        populated as a side effect.
+
         Returns:
-            Validated EmberConfig instance
+            Validated EmberConfig instance owned by the caller
 
         Raises:
             ConfigError: On loading or validation failure
         """
-        with self._lock:
-            try:
-                self._logger.debug("Loading configuration...")
-                config = load_config(file_path=self._config_path)
-                self._logger.debug("Configuration loaded successfully")
-                return config
-            except Exception as e:
-                self._logger.error(f"Error loading configuration: {e}")
-                raise ConfigError(f"Failed to load configuration: {e}")
+        return self._load_snapshot().owned_config()
+
+    def _load_snapshot(self) -> _ConfigSnapshot:
+        """
+        Get a snapshot of the configuration sources through the shared cache.
+
+        Returns:
+            Snapshot of the current configuration sources
+
+        Raises:
+            ConfigError: If the sources cannot be read
+        """
+        cache_key = self._cache_key()
+        if cache_key is not None:
+            path, stamp = cache_key[0], cache_key[1:]
+            with _CONFIG_CACHE_LOCK:
+                cached = _CONFIG_CACHE.get(path)
+            if cached is not None and cached[0] == stamp:
+                self._logger.debug("Using cached configuration")
+                return cached[1]
+
+        snapshot = _ConfigSnapshot(raw=self._read_sources())
+        if cache_key is not None:
+            with _CONFIG_CACHE_LOCK:
+                _CONFIG_CACHE[path] = (stamp, snapshot)
+        return snapshot
+
+    def _read_sources(self) -> Dict[str, Any]:
+        """
+        Read raw configuration data from file and environment, bypassing the cache.
+
+        Returns:
+            Raw merged configuration dictionary
+
+        Raises:
+            ConfigError: If the sources cannot be read
+        """
+        try:
+            self._logger.debug("Loading configuration...")
+            data = load_config_data(file_path=self._resolved_path)
+            self._logger.debug("Configuration loaded successfully")
+            return data
+        except Exception as e:
+            self._logger.error("Error loading configuration: %s", e)
+            raise ConfigError(f"Failed to load configuration: {e}")
+
+    def _cache_key(self) -> Optional[Tuple[Any, ...]]:
+        """
+        Build the cache key for the current configuration sources.
+
+        Returns:
+            Cache key, or None if the configuration should not be cached
+            (no explicit path, missing file, or EMBER_* environment overrides)
+        """
+        if self._resolved_path is None:
+            return None
+        if any(name.startswith("EMBER_") for name in os.environ):
+            return None
+        path = self._resolved_path
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        # ${VAR} references in the file are resolved at load time, so the
+        # environment is part of the key.
+        env_fingerprint = hash(frozenset(os.environ.items()))
+        return (path, stat.st_mtime_ns, stat.st_size, env_fingerprint)
+
+    @staticmethod
+    def invalidate_cache() -> None:
+        """Clear the shared cache of loaded configurations."""
+        with _CONFIG_CACHE_LOCK:
+            _CONFIG_CACHE.clear()
 
     def reload(self) -> EmberConfig:
         """
         Reload configuration from sources.
 
+        The shared configuration cache is bypassed so the sources are always
+        re-read.
+
         Returns:
             Newly loaded EmberConfig instance
+
+        Raises:
+            ConfigError: On loading or validation failure
+        """
+        with self._lock:
+            self._snapshot = self._fresh_snapshot()
+            return self._snapshot.config()
+
+    def reload_async(self) -> "Future[EmberConfig]":
+        """
+        Reload configuration in the background.
+
+        Sources are re-read and validated on a worker thread without holding
+        the lock, so readers keep getting the current snapshot until the new
+        one is published. If loading fails, the error is logged and the
+        current snapshot stays in place. If another write (reload() or
+        set_provider_api_key()) publishes first, the background result is
+        discarded rather than overwriting the newer snapshot.
+
+        Returns:
+            Future resolving to the newly loaded EmberConfig, or raising
+            ConfigError if loading failed
+        """
+        with self._lock:
+            if self._reload_executor is None:
+                self._reload_executor = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="ember-config-reload"
+                )
+            return self._reload_executor.submit(self._reload_in_background)
+
+    def close(self, wait: bool = True) -> None:
+        """
+        Shut down the background reload worker, if one was started.
+
+        The manager stays usable; a later reload_async() starts a new worker.
+
+        Args:
+            wait: Whether to block until a pending background reload finishes
+        """
+        with self._lock:
+            executor, self._reload_executor = self._reload_executor, None
+        # Shut down outside the lock: a pending reload takes it to publish.
+        if executor is not None:
+            executor.shutdown(wait=wait)
+
+    def _reload_in_background(self) -> EmberConfig:
+        """
+        Build a fresh snapshot and publish it once it has validated.
+
+        Returns:
+            Newly loaded EmberConfig instance, or the current one if a newer
+            snapshot was published while the sources were being read
+
+        Raises:
+            ConfigError: On loading or validation failure
         """
+        base = self._snapshot
+        try:
+            snapshot = self._fresh_snapshot()
+        except ConfigError as e:
+            self._logger.error(
+                "Background reload failed, keeping current configuration: %s", e
+            )
+            raise
         with self._lock:
-            self._config = self.load()
-            return self._config
+            if self._snapshot is not base:
+                self._logger.debug(
+                    "Background reload superseded by a newer configuration"
+                )
+                snapshot = self._snapshot
+            else:
+                self._snapshot = snapshot
+        return snapshot.config()
+
+    def _fresh_snapshot(self) -> _ConfigSnapshot:
+        """
+        Read and fully validate the sources, bypassing the shared cache.
+
+        Returns:
+            Fully validated snapshot
+
+        Raises:
+            ConfigError: On loading or validation failure
+        """
+        snapshot = _ConfigSnapshot(raw=self._read_sources())
+        snapshot.config()
+        return snapshot
 
     def get_config(self) -> EmberConfig:
         """
         Get the current configuration.
 
         Returns:
-            Current EmberConfig instance
+            Current EmberConfig snapshot; must not be mutated
+
+        Raises:
+            ConfigError: If the configuration fails validation
         """
-        with self._lock:
-            return self._config
+        return self._snapshot.config()
 
     def set_provider_api_key(self, provider_name: str, api_key: str) -> None:
         """
@@ -88,20 +481,27 @@ class ConfigManager:
             api_key: API key to set
         """
         with self._lock:
-            if provider_name not in self._config.registry.providers:
-                self._config.registry.providers[provider_name] = {}
-
-            # Create providers.{provider}.api_keys.default.key
-            if not hasattr(self._config.registry.providers[provider_name], "api_keys"):
-                self._config.registry.providers[provider_name].api_keys = {}
+            config = self._snapshot.config()
+            registry = config.registry
 
-            if "default" not in self._config.registry.providers[provider_name].api_keys:
-                self._config.registry.providers[provider_name].api_keys["default"] = {}
+            # Copy only the path down to providers.{provider}.api_keys.default.key;
+            # everything else is shared with the previous (immutable) snapshot.
+            provider = registry.providers.get(provider_name)
+            if provider is None:
+                provider = Provider()
+                provider.__root_key__ = provider_name
+            api_keys = dict(provider.api_keys)
+            api_keys["default"] = {**api_keys.get("default", {}), "key": api_key}
 
-            self._config.registry.providers[provider_name].api_keys["default"][
-                "key"
-            ] = api_key
-            self._logger.debug(f"Set API key for provider {provider_name}")
+            providers = dict(registry.providers)
+            providers[provider_name] = provider.model_copy(
+                update={"api_keys": api_keys}
+            )
+            config = config.model_copy(
+                update={"registry": registry.model_copy(update={"providers": providers})}
+            )
+            self._snapshot = _ConfigSnapshot(config=config)
+            self._logger.debug("Set API key for provider %s", provider_name)
 
     def get(self, section: str, key: str, default: Any = None) -> Any:
         """
@@ -114,17 +514,40 @@ class ConfigManager:
 
         Returns:
             Configuration value or default
+
+        Raises:
+            ConfigError: If the section fails validation
         """
-        with self._lock:
-            try:
-                if hasattr(self._config, section):
-                    section_obj = getattr(self._config, section)
-                    if hasattr(section_obj, key):
-                        return getattr(section_obj, key)
-            except (AttributeError, TypeError):
-                pass
-
-            return default
+        value = self._snapshot.value(section, key)
+        return default if value is _MISSING else value
+
+    def get_many(
+        self,
+        specs: Iterable[Tuple[str, str]],
+        defaults: Optional[Dict[Tuple[str, str], Any]] = None,
+    ) -> Dict[Tuple[str, str], Any]:
+        """
+        Get several configuration values from one consistent snapshot.
+
+        Args:
+            specs: (section, key) pairs to look up
+            defaults: Per-pair defaults for values that are not found
+
+        Returns:
+            Mapping from each (section, key) pair to its value or default
+
+        Raises:
+            ConfigError: If a requested section fails validation
+        """
+        snapshot = self._snapshot
+        defaults = defaults or {}
+        values: Dict[Tuple[str, str], Any] = {}
+        for section, key in specs:
+            value = snapshot.value(section, key)
+            values[(section, key)] = (
+                defaults.get((section, key)) if value is _MISSING else value
+            )
+        return values
 
 
 def create_config_manager(
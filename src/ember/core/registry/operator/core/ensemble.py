@@ -15,6 +15,7 @@ and reliability-focused LLM applications.
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import List
 
 from ember.core.types import EmberModel
@@ -23,6 +24,7 @@ from ember.core.registry.operator.base.operator_base import Operator
 
 from ember.core.registry.specification.specification import Specification
 from ember.core.registry.model.model_module.lm import LMModule
+from ember.xcs.engine.execution_options import get_execution_options
 
 
 class EnsembleOperatorInputs(EmberModel):
@@ -75,8 +77,12 @@ class EnsembleOperator(Operator[EnsembleOperatorInputs, EnsembleOperatorOutputs]
     This enables multiple independent samples from language models, which can
     be used for robustness, consensus, or diversity of outputs.
 
-    The execution is implicitly parallel, with each model potentially running
-    concurrently depending on the implementation.
+    The model calls are independent and latency-bound, so with more than one
+    module they are dispatched concurrently on a thread pool; wall-clock time
+    is then bounded by the slowest model rather than the sum of all of them.
+    The pool honours the XCS execution options: use_parallel=False runs the
+    models one after another, and max_workers caps the number of concurrent
+    calls.
     """
 
     specification: Specification = Specification(
@@ -116,5 +122,20 @@ class EnsembleOperator(Operator[EnsembleOperatorInputs, EnsembleOperatorOutputs]
             the original lm_modules order.
         """
         rendered_prompt: str = self.specification.render_prompt(inputs=inputs)
-        responses: List[str] = [lm(prompt=rendered_prompt) for lm in self.lm_modules]
+        options = get_execution_options()
+        max_workers = len(self.lm_modules)
+        if options.max_workers is not None:
+            max_workers = min(max_workers, options.max_workers)
+        if not options.use_parallel or max_workers <= 1:
+            responses: List[str] = [
+                lm(prompt=rendered_prompt) for lm in self.lm_modules
+            ]
+            return {"responses": responses}
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(lm, prompt=rendered_prompt) for lm in self.lm_modules
+            ]
+            # Collect in submission order to preserve the lm_modules ordering
+            responses = [future.result() for future in futures]
         return {"responses": responses}
@@ -1,8 +1,10 @@
 from __future__ import annotations
-from typing import Any, Dict, Generic, List, Optional, Type, TypeVar, Union
+from typing import Any, Dict, FrozenSet, Generic, List, Optional, Type, TypeVar, Union
+import functools
 import logging
+import string
 
-from pydantic import BaseModel, model_validator
+from pydantic import BaseModel, ConfigDict, model_validator
 
 from ember.core.registry.specification.exceptions import (
     PlaceholderMissingError,
@@ -17,6 +19,38 @@ InputModelT = TypeVar("InputModelT", bound=EmberModel)
 OutputModelT = TypeVar("OutputModelT", bound=EmberModel)
 
 
+@functools.lru_cache(maxsize=256)
+def _template_fields(prompt_template: str) -> Optional[FrozenSet[str]]:
+    """Parse a prompt template once and return the input names it references.
+
+    Args:
+        prompt_template (str): Template string in str.format syntax.
+
+    Returns:
+        Optional[FrozenSet[str]]: Top-level names referenced by the template, including
+            those nested in format specs such as "{x:>{width}}", or None if the template
+            uses positional fields or cannot be parsed.
+    """
+    names = set()
+    try:
+        for _, field_name, format_spec, _ in string.Formatter().parse(prompt_template):
+            if field_name is None:
+                continue
+            # "{user.name}" and "{items[0]}" both depend on the top-level input only.
+            name = field_name.split(".", 1)[0].split("[", 1)[0]
+            if not name.isidentifier():
+                return None
+            names.add(name)
+            if format_spec and "{" in format_spec:
+                nested = _template_fields(format_spec)
+                if nested is None:
+                    return None
+                names.update(nested)
+    except ValueError:
+        return None
+    return frozenset(names)
+
+
 class Specification(EmberModel, Generic[InputModelT, OutputModelT]):
     """Base class representing an operator's specification.
 
@@ -25,8 +59,13 @@ class Specification(EmberModel, Generic[InputModelT, OutputModelT]):
         structured_output (Optional[Type[OutputModelT]]): Pydantic model class used for output validation.
         input_model (Optional[Type[InputModelT]]): Pydantic model class defining the expected input fields.
         check_all_placeholders (bool): Flag to enforce that all required placeholders are included in the prompt template.
+
+    Specifications are frozen: they are shared by every instance of an operator
+    class, so fields cannot be reassigned after validation.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     prompt_template: Optional[str] = None
     structured_output: Optional[Type[OutputModelT]] = None
     input_model: Optional[Type[InputModelT]] = None
@@ -97,14 +136,22 @@ class Specification(EmberModel, Generic[InputModelT, OutputModelT]):
             logger.error(error_msg)
             raise PlaceholderMissingError(message=error_msg)
 
-        # Convert inputs to dictionary if it's a model
+        template_fields: Optional[FrozenSet[str]] = None
+        if self.prompt_template is not None:
+            template_fields = _template_fields(self.prompt_template)
+
+        # Convert inputs to dictionary if it's a model; when the template's
+        # placeholders are known, only the referenced fields are serialized.
         input_dict: Dict[str, Any] = inputs
         if isinstance(inputs, EmberModel):
-            input_dict = inputs.as_dict()
+            if template_fields is not None:
+                input_dict = inputs.model_dump(include=set(template_fields))
+            else:
+                input_dict = inputs.as_dict()
 
         if self.prompt_template is not None:
             try:
-                prompt: str = self.prompt_template.format(**input_dict)
+                prompt: str = self.prompt_template.format_map(input_dict)
                 return prompt
             except KeyError as key_err:
                 error_msg: str = f"Missing input for placeholder: {key_err}"
@@ -13,23 +13,45 @@ To run:
     poetry run python src/ember/examples/composition_example.py
 """
 
+import contextlib
+import dataclasses
+import functools
 import logging
+import threading
 import time
-from typing import Any, Dict, List, Callable, Optional, TypeVar, cast
+from typing import (
+    Any,
+    ClassVar,
+    Dict,
+    Iterator,
+    List,
+    Callable,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    cast,
+)
 
-from pydantic import BaseModel
 from prettytable import PrettyTable
 
 # ember API imports
 from ember.api import non
-from ember.api.operator import Operator, Specification
+from ember.api.operator import EmberModel, Operator, Specification
 from ember.api.models import LMModule, LMModuleConfig
-from ember.api.xcs import jit, execution_options
+from ember.api.xcs import jit
+from ember.xcs.engine.execution_options import (
+    get_execution_options,
+    set_execution_options,
+)
 
 T = TypeVar("T")
 U = TypeVar("U")
 V = TypeVar("V")
 
+# Guards QuestionRefinement._cache; the LM call itself runs outside the lock.
+_REFINEMENT_CACHE_LOCK = threading.Lock()
+
 
 ###############################################################################
 # Composition Utilities
@@ -51,16 +73,32 @@ def compose(f: Callable[[U], V], g: Callable[[T], U]) -> Callable[[T], V]:
     return composed
 
 
+@contextlib.contextmanager
+def _sequential_execution() -> Iterator[None]:
+    """Run operators one call at a time for the duration of the block."""
+    saved = get_execution_options()
+    set_execution_options(use_parallel=False)
+    try:
+        yield
+    finally:
+        set_execution_options(**dataclasses.asdict(saved))
+
+
+def _truncate(text: str, limit: int) -> str:
+    """Shorten text to at most `limit` characters, marking the cut with "..."."""
+    return text if len(text) <= limit else text[:limit] + "..."
+
+
 ###############################################################################
 # Custom Operators
 ###############################################################################
-class QuestionRefinementInputs(BaseModel):
+class QuestionRefinementInputs(EmberModel):
     """Input model for QuestionRefinement operator."""
 
     query: str
 
 
-class QuestionRefinementOutputs(BaseModel):
+class QuestionRefinementOutputs(EmberModel):
     """Output model for QuestionRefinement operator."""
 
     refined_query: str
@@ -69,9 +107,9 @@ class QuestionRefinementOutputs(BaseModel):
 class QuestionRefinementSpecification(Specification):
     """Specification for QuestionRefinement operator."""
 
-    input_model = QuestionRefinementInputs
-    output_model = QuestionRefinementOutputs
-    prompt_template = (
+    input_model: Type[QuestionRefinementInputs] = QuestionRefinementInputs
+    structured_output: Type[QuestionRefinementOutputs] = QuestionRefinementOutputs
+    prompt_template: str = (
         "You are an expert at refining questions to make them clearer and more precise.\n"
         "Please refine the following question:\n\n"
         "{query}\n\n"
@@ -81,9 +119,14 @@ class QuestionRefinementSpecification(Specification):
 
 @jit()
 class QuestionRefinement(Operator[QuestionRefinementInputs, QuestionRefinementOutputs]):
-    """Operator that refines a user question to make it more precise."""
+    """Operator that refines a user question to make it more precise.
+
+    Refinements are cached per (model_name, temperature, query) across all
+    instances, so pipelines that refine the same question share one LM call.
+    """
 
     specification: ClassVar[Specification] = QuestionRefinementSpecification()
+    _cache: ClassVar[Dict[Tuple[str, float, str], Dict[str, Any]]] = {}
     model_name: str
     temperature: float
 
@@ -99,16 +142,54 @@ class QuestionRefinement(Operator[QuestionRefinementInputs, QuestionRefinementOu
             )
         )
 
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Drop all cached refinements."""
+        with _REFINEMENT_CACHE_LOCK:
+            cls._cache.clear()
+
     def forward(self, *, inputs: QuestionRefinementInputs) -> Dict[str, Any]:
+        key = (self.model_name, self.temperature, inputs.query)
+        with _REFINEMENT_CACHE_LOCK:
+            cached = self._cache.get(key)
+        if cached is not None:
+            return dict(cached)
+
         prompt = self.specification.render_prompt(inputs=inputs)
-        response = self.lm_module(prompt=prompt)
+        # LMModule returns the completion text directly
+        refined_query = self.lm_module(prompt=prompt).strip()
 
-        # Extract text from response
-        from ember.api.types import extract_value
+        result = {"refined_query": refined_query}
+        with _REFINEMENT_CACHE_LOCK:
+            self._cache[key] = dict(result)
+        return result
 
-        refined_query = extract_value(response, "text", "").strip()
 
-        return {"refined_query": refined_query}
+###############################################################################
+# Shared Operator Factories
+###############################################################################
+# Operators are immutable after construction, so the three pipelines can share
+# one instance of each instead of each building its own LM modules.
+@functools.lru_cache(maxsize=None)
+def _get_refiner(model_name: str, temperature: float = 0.3) -> QuestionRefinement:
+    """Get the shared QuestionRefinement operator for a model."""
+    return QuestionRefinement(model_name=model_name, temperature=temperature)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_ensemble(
+    model_name: str, temperature: float = 0.7, num_units: int = 3
+) -> non.UniformEnsemble:
+    """Get the shared UniformEnsemble operator for a model."""
+    return non.UniformEnsemble(
+        num_units=num_units, model_name=model_name, temperature=temperature
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _get_aggregator() -> non.MostCommon:
+    """Get the shared MostCommon aggregator."""
+    return non.MostCommon()
 
 
 ###############################################################################
@@ -123,10 +204,10 @@ def create_functional_pipeline(*, model_name: str) -> Callable[[Dict[str, Any]],
     Returns:
         A callable pipeline function
     """
-    # Create individual operators
-    refiner = QuestionRefinement(model_name=model_name)
-    ensemble = non.UniformEnsemble(num_units=3, model_name=model_name, temperature=0.7)
-    aggregator = non.MostCommon()
+    # Get the shared operators
+    refiner = _get_refiner(model_name)
+    ensemble = _get_ensemble(model_name)
+    aggregator = _get_aggregator()
 
     # Use partial application to adapt the interfaces
     def adapt_refiner_output(inputs: Dict[str, Any]) -> Dict[str, Any]:
@@ -137,8 +218,12 @@ def create_functional_pipeline(*, model_name: str) -> Callable[[Dict[str, Any]],
         result = ensemble(inputs=inputs)
         return {"query": inputs["query"], "responses": result["responses"]}
 
+    # Operators take keyword-only inputs, so the aggregator is adapted too
+    def aggregate(inputs: Dict[str, Any]) -> Any:
+        return aggregator(inputs=inputs)
+
     # Compose the pipeline
-    pipeline = compose(aggregator, compose(adapt_ensemble_output, adapt_refiner_output))
+    pipeline = compose(aggregate, compose(adapt_ensemble_output, adapt_refiner_output))
 
     return pipeline
 
@@ -150,12 +235,12 @@ def create_functional_pipeline(*, model_name: str) -> Callable[[Dict[str, Any]],
 class NestedPipeline(Operator[Dict[str, Any], Dict[str, Any]]):
     """Pipeline implemented as a container class with nested operators."""
 
+    specification: ClassVar[Specification] = Specification()
+
     def __init__(self, *, model_name: str) -> None:
-        self.refiner = QuestionRefinement(model_name=model_name)
-        self.ensemble = non.UniformEnsemble(
-            num_units=3, model_name=model_name, temperature=0.7
-        )
-        self.aggregator = non.MostCommon()
+        self.refiner = _get_refiner(model_name)
+        self.ensemble = _get_ensemble(model_name)
+        self.aggregator = _get_aggregator()
 
     def forward(self, *, inputs: Dict[str, Any]) -> Dict[str, Any]:
         # Step 1: Refine the question
@@ -187,10 +272,10 @@ def create_sequential_pipeline(*, model_name: str) -> Callable[[Dict[str, Any]],
     Returns:
         A callable pipeline function
     """
-    # Create individual operators
-    refiner = QuestionRefinement(model_name=model_name)
-    ensemble = non.UniformEnsemble(num_units=3, model_name=model_name, temperature=0.7)
-    aggregator = non.MostCommon()
+    # Get the shared operators
+    refiner = _get_refiner(model_name)
+    ensemble = _get_ensemble(model_name)
+    aggregator = _get_aggregator()
 
     # Create the chained function
     def pipeline(inputs: Dict[str, Any]) -> Any:
@@ -234,116 +319,56 @@ def main() -> None:
     table.field_names = ["Pipeline", "Time (s)", "Result"]
     table.align = "l"
 
-    # Process questions with each pipeline
-    print("\n=== Functional Composition Pipeline ===")
-    for question in questions[:1]:  # Use first question only for brevity
-        print(f"\nProcessing: {question}")
-        start_time = time.perf_counter()
-        result = functional_pipeline({"query": question})
-        elapsed = time.perf_counter() - start_time
-
-        # Show details of pipeline execution
-        print(f'Original query: "{question}"')
-        if "refined_query" in result:
-            print(f"Refined query: \"{result['refined_query']}\"")
-        print(
-            f"Final answer: \"{result['final_answer'][:150]}...\""
-            if len(result["final_answer"]) > 150
-            else f"Final answer: \"{result['final_answer']}\""
-        )
-        print(f"Time: {elapsed:.4f}s")
-
-        # Store in table
-        table.add_row(
-            [
-                "Functional",
-                f"{elapsed:.4f}",
-                result["final_answer"][:50] + "..."
-                if len(result["final_answer"]) > 50
-                else result["final_answer"],
-            ]
-        )
-
-    print("\n=== Nested Pipeline ===")
-    for question in questions[:1]:
-        print(f"\nProcessing: {question}")
-        start_time = time.perf_counter()
-        result = nested_pipeline(inputs={"query": question})
-        elapsed = time.perf_counter() - start_time
-
-        # Show details of pipeline execution
-        print(
-            f"Final answer: \"{result['final_answer'][:150]}...\""
-            if len(result["final_answer"]) > 150
-            else f"Final answer: \"{result['final_answer']}\""
-        )
-        print(f"Time: {elapsed:.4f}s")
-
-        # Store in table
-        table.add_row(
-            [
-                "Nested",
-                f"{elapsed:.4f}",
-                result["final_answer"][:50] + "..."
-                if len(result["final_answer"]) > 50
-                else result["final_answer"],
-            ]
-        )
-
-    print("\n=== Sequential Pipeline ===")
-    for question in questions[:1]:
-        print(f"\nProcessing: {question}")
-        start_time = time.perf_counter()
-        result = sequential_pipeline({"query": question})
-        elapsed = time.perf_counter() - start_time
-
-        # Show details of pipeline execution
-        print(
-            f"Final answer: \"{result['final_answer'][:150]}...\""
-            if len(result["final_answer"]) > 150
-            else f"Final answer: \"{result['final_answer']}\""
-        )
-        print(f"Time: {elapsed:.4f}s")
-
-        # Store in table
-        table.add_row(
-            [
-                "Sequential",
-                f"{elapsed:.4f}",
-                result["final_answer"][:50] + "..."
-                if len(result["final_answer"]) > 50
-                else result["final_answer"],
-            ]
-        )
+    # (title, table label, pipeline, show query details, run sequentially)
+    pipelines: List[Tuple[str, str, Callable[[Dict[str, Any]], Any], bool, bool]] = [
+        (
+            "Functional Composition Pipeline",
+            "Functional",
+            functional_pipeline,
+            True,
+            False,
+        ),
+        (
+            "Nested Pipeline",
+            "Nested",
+            lambda inputs: nested_pipeline(inputs=inputs),
+            False,
+            False,
+        ),
+        ("Sequential Pipeline", "Sequential", sequential_pipeline, False, False),
+        (
+            "Nested Pipeline with Sequential Execution",
+            "Nested (Sequential)",
+            lambda inputs: nested_pipeline(inputs=inputs),
+            False,
+            True,
+        ),
+    ]
 
-    # Demonstrate execution options with the nested pipeline
-    print("\n=== Nested Pipeline with Sequential Execution ===")
-    with execution_options(scheduler="sequential"):
-        for question in questions[:1]:
-            print(f"\nProcessing: {question}")
-            start_time = time.perf_counter()
-            result = nested_pipeline(inputs={"query": question})
-            elapsed = time.perf_counter() - start_time
-
-            # Show details of pipeline execution
-            print(
-                f"Final answer: \"{result['final_answer'][:150]}...\""
-                if len(result["final_answer"]) > 150
-                else f"Final answer: \"{result['final_answer']}\""
-            )
-            print(f"Time: {elapsed:.4f}s")
-            print(f"Execution mode: Sequential scheduler")
-
-            # Store in table
-            table.add_row(
-                [
-                    "Nested (Sequential)",
-                    f"{elapsed:.4f}",
-                    result["final_answer"][:50] + "..."
-                    if len(result["final_answer"]) > 50
-                    else result["final_answer"],
-                ]
-            )
+    # Process questions with each pipeline
+    for title, label, pipeline, show_queries, sequential in pipelines:
+        print(f"\n=== {title} ===")
+        options = _sequential_execution() if sequential else contextlib.nullcontext()
+        with options:
+            for question in questions[:1]:  # Use first question only for brevity
+                print(f"\nProcessing: {question}")
+                start_time = time.perf_counter()
+                result = pipeline({"query": question})
+                elapsed = time.perf_counter() - start_time
+                final_answer = result["final_answer"]
+
+                # Show details of pipeline execution
+                if show_queries:
+                    print(f'Original query: "{question}"')
+                    if "refined_query" in result:
+                        print(f"Refined query: \"{result['refined_query']}\"")
+                print(f'Final answer: "{_truncate(final_answer, 150)}"')
+                print(f"Time: {elapsed:.4f}s")
+                if sequential:
+                    print("Execution mode: Sequential scheduler")
+
+                # Store in table
+                table.add_row([label, f"{elapsed:.4f}", _truncate(final_answer, 50)])
 
     # Display performance comparison
     print("\n=== Performance Comparison ===")
@@ -68,6 +68,32 @@ class Specification:
         return str(inputs)
 
 
+class PassthroughSpecification:
+    """Specification stub whose validation and rendering are all no-ops.
+
+    Stateless, so tests that only need the specification interface can share
+    DUMMY_SPECIFICATION instead of building their own class per operator.
+    """
+
+    def __init__(self, input_model=dict):
+        self.input_model = input_model
+
+    def validate_inputs(self, *, inputs):
+        """Return inputs unchanged."""
+        return inputs
+
+    def validate_output(self, *, output):
+        """Return output unchanged."""
+        return output
+
+    def render_prompt(self, *, inputs):
+        """Return a fixed prompt."""
+        return "dummy prompt"
+
+
+DUMMY_SPECIFICATION = PassthroughSpecification()
+
+
 class EmberModule:
     """Simplified EmberModule stub."""
 
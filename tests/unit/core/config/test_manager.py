@@ -0,0 +1,447 @@
+"""Tests for the configuration manager module.
+
+This module contains tests for the ConfigManager class in ember.core.config.manager.
+"""
+
+import os
+import threading
+import pytest
+import yaml
+from unittest.mock import patch
+
+from ember.core.config import manager as manager_module
+from ember.core.config.exceptions import ConfigError
+from ember.core.config.manager import ConfigManager, create_config_manager
+
+
+@pytest.fixture(autouse=True)
+def clean_environment(monkeypatch):
+    """Remove EMBER_* overrides and reset the shared config cache."""
+    for name in list(os.environ):
+        if name.startswith("EMBER_"):
+            monkeypatch.delenv(name)
+    ConfigManager.invalidate_cache()
+    yield
+    ConfigManager.invalidate_cache()
+
+
+@pytest.fixture
+def config_file(tmp_path):
+    """Create a temporary configuration file."""
+    config = {
+        "registry": {
+            "auto_discover": False,
+            "providers": {
+                "openai": {
+                    "enabled": True,
+                    "api_key": "key1",
+                }
+            },
+        },
+        "logging": {"level": "DEBUG"},
+    }
+    path = tmp_path / "config.yaml"
+    path.write_text(yaml.dump(config))
+    return str(path)
+
+
+class TestConfigManagerCache:
+    """Tests for the shared configuration cache."""
+
+    def test_second_manager_hits_cache(self, config_file):
+        """Test that a second manager for the same file skips loading."""
+        first = create_config_manager(config_path=config_file)
+
+        with patch.object(manager_module, "load_config_data") as mock_load:
+            second = create_config_manager(config_path=config_file)
+            mock_load.assert_not_called()
+
+        assert second.get_config().logging.level == "DEBUG"
+        # Snapshots are immutable, so managers for the same file share one
+        assert second.get_config() is first.get_config()
+
+    def test_cache_returns_independent_copies(self, config_file):
+        """Test that mutating one manager does not leak into another."""
+        first = create_config_manager(config_path=config_file)
+        first.set_provider_api_key("openai", "changed")
+
+        second = create_config_manager(config_path=config_file)
+        provider = second.get_config().registry.providers["openai"]
+        assert "default" not in provider.api_keys
+
+    def test_file_change_invalidates(self, config_file):
+        """Test that modifying the file produces a fresh configuration."""
+        create_config_manager(config_path=config_file)
+
+        with open(config_file, "w") as f:
+            yaml.dump({"logging": {"level": "WARNING", "extra": "x" * 32}}, f)
+
+        manager = create_config_manager(config_path=config_file)
+        assert manager.get_config().logging.level == "WARNING"
+
+    def test_file_change_replaces_cache_entry(self, config_file):
+        """Test that a changed file does not leave its stale snapshot cached."""
+        create_config_manager(config_path=config_file)
+
+        for i in range(3):
+            with open(config_file, "w") as f:
+                yaml.dump({"logging": {"level": "WARNING", "extra": "x" * (40 + i)}}, f)
+            create_config_manager(config_path=config_file)
+
+        assert len(manager_module._CONFIG_CACHE) == 1
+
+    def test_env_overrides_bypass_cache(self, config_file, monkeypatch):
+        """Test that EMBER_* overrides disable caching."""
+        create_config_manager(config_path=config_file)
+        monkeypatch.setenv("EMBER_LOGGING_LEVEL", "ERROR")
+
+        manager = create_config_manager(config_path=config_file)
+        assert manager.get_config().logging.level == "ERROR"
+
+    def test_reload_bypasses_cache(self, config_file):
+        """Test that reload always re-reads the sources."""
+        manager = create_config_manager(config_path=config_file)
+
+        with patch.object(
+            manager_module, "load_config_data", wraps=manager_module.load_config_data
+        ) as mock_load:
+            manager.reload()
+            mock_load.assert_called_once()
+
+    def test_invalidate_cache(self, config_file):
+        """Test that invalidate_cache forces the next load to re-read."""
+        create_config_manager(config_path=config_file)
+        ConfigManager.invalidate_cache()
+
+        with patch.object(
+            manager_module, "load_config_data", wraps=manager_module.load_config_data
+        ) as mock_load:
+            create_config_manager(config_path=config_file)
+            mock_load.assert_called_once()
+
+
+class TestConfigManagerSnapshots:
+    """Tests for copy-on-write configuration snapshots."""
+
+    def test_set_provider_api_key_publishes_new_snapshot(self, config_file):
+        """Test that writers swap in a new config instead of mutating."""
+        manager = create_config_manager(config_path=config_file)
+        before = manager.get_config()
+
+        manager.set_provider_api_key("openai", "new-key")
+
+        after = manager.get_config()
+        assert after is not before
+        assert after.registry.providers["openai"].api_keys["default"]["key"] == (
+            "new-key"
+        )
+        assert "default" not in before.registry.providers["openai"].api_keys
+
+    def test_get_reads_current_snapshot(self, config_file):
+        """Test that get() reflects the latest published snapshot."""
+        manager = create_config_manager(config_path=config_file)
+        assert manager.get("logging", "level") == "DEBUG"
+        assert manager.get("logging", "missing", "fallback") == "fallback"
+        assert manager.get("missing", "level", "fallback") == "fallback"
+
+
+class TestConfigManagerLazyValidation:
+    """Tests for deferred validation of configuration sections."""
+
+    @pytest.fixture
+    def invalid_registry_file(self, tmp_path):
+        """Create a config file whose registry section fails validation."""
+        path = tmp_path / "config.yaml"
+        path.write_text(
+            yaml.dump(
+                {
+                    "registry": {"providers": "not-a-mapping"},
+                    "logging": {"level": "WARNING"},
+                }
+            )
+        )
+        return str(path)
+
+    def test_get_validates_only_requested_section(self, invalid_registry_file):
+        """Test that reading one section does not validate the others."""
+        manager = create_config_manager(config_path=invalid_registry_file)
+        assert manager.get("logging", "level") == "WARNING"
+
+    def test_invalid_section_raises_on_access(self, invalid_registry_file):
+        """Test that validation errors surface when the section is read."""
+        manager = create_config_manager(config_path=invalid_registry_file)
+        with pytest.raises(ConfigError):
+            manager.get("registry", "providers")
+        with pytest.raises(ConfigError):
+            manager.get_config()
+
+    def test_reload_validates_eagerly(self, invalid_registry_file):
+        """Test that reload surfaces validation errors immediately."""
+        manager = create_config_manager(config_path=invalid_registry_file)
+        with pytest.raises(ConfigError):
+            manager.reload()
+
+
+class TestConfigManagerReloadAsync:
+    """Tests for stale-while-revalidate background reloads."""
+
+    def test_reload_async_publishes_new_config(self, config_file):
+        """Test that a background reload swaps in the updated file."""
+        manager = create_config_manager(config_path=config_file)
+        with open(config_file, "w") as f:
+            yaml.dump({"logging": {"level": "ERROR"}}, f)
+
+        config = manager.reload_async().result(timeout=5)
+
+        assert config.logging.level == "ERROR"
+        assert manager.get_config() is config
+
+    def test_reload_async_failure_keeps_stale_config(self, config_file):
+        """Test that a failed background reload leaves the old config in place."""
+        manager = create_config_manager(config_path=config_file)
+        before = manager.get_config()
+        with open(config_file, "w") as f:
+            f.write("registry: [unclosed")
+
+        future = manager.reload_async()
+
+        with pytest.raises(ConfigError):
+            future.result(timeout=5)
+        assert manager.get_config() is before
+
+    def test_reload_async_does_not_overwrite_newer_config(self, config_file):
+        """Test that a slow background reload loses to a later reload()."""
+        manager = create_config_manager(config_path=config_file)
+        real_load = manager_module.load_config_data
+        read_started = threading.Event()
+        release = threading.Event()
+
+        def load(**kwargs):
+            data = real_load(**kwargs)
+            if threading.current_thread().name.startswith("ember-config-reload"):
+                read_started.set()
+                assert release.wait(timeout=5)
+            return data
+
+        with patch.object(manager_module, "load_config_data", side_effect=load):
+            future = manager.reload_async()
+            assert read_started.wait(timeout=5)
+
+            with open(config_file, "w") as f:
+                yaml.dump({"logging": {"level": "ERROR"}}, f)
+            newer = manager.reload()
+
+            release.set()
+            result = future.result(timeout=5)
+
+        assert newer.logging.level == "ERROR"
+        assert manager.get_config() is newer
+        assert result is newer
+
+    def test_executor_is_created_lazily(self, config_file):
+        """Test that constructing a manager starts no reload worker."""
+        manager = create_config_manager(config_path=config_file)
+        assert manager._reload_executor is None
+
+        manager.reload_async().result(timeout=5)
+        assert manager._reload_executor is not None
+
+    def test_close_shuts_down_executor(self, config_file):
+        """Test that close() waits for a pending reload and releases the worker."""
+        manager = create_config_manager(config_path=config_file)
+        future = manager.reload_async()
+
+        manager.close()
+
+        assert future.done()
+        assert manager._reload_executor is None
+        # The manager stays usable after close()
+        assert manager.reload_async().result(timeout=5).logging.level == "DEBUG"
+        manager.close()
+
+
+class TestConfigManagerGetCache:
+    """Tests for memoized get() lookups."""
+
+    def test_repeated_get_skips_attribute_walk(self, config_file):
+        """Test that a second get() for the same key is served from the cache."""
+        manager = create_config_manager(config_path=config_file)
+        assert manager.get("logging", "level") == "DEBUG"
+        assert manager.get("logging", "missing") is None
+
+        with patch.object(manager_module._ConfigSnapshot, "section") as mock_section:
+            assert manager.get("logging", "level") == "DEBUG"
+            assert manager.get("logging", "missing", "fallback") == "fallback"
+            mock_section.assert_not_called()
+
+    def test_validated_config_is_precomputed(self, config_file):
+        """Test that first get() calls after a full validation skip the walk."""
+        manager = create_config_manager(config_path=config_file)
+        config = manager.reload()
+
+        with patch.object(manager_module._ConfigSnapshot, "section") as mock_section:
+            assert manager.get("logging", "level") == "DEBUG"
+            assert manager.get("registry", "providers") is config.registry.providers
+            mock_section.assert_not_called()
+
+    def test_writes_invalidate_cached_values(self, config_file):
+        """Test that get() reflects changes made by set_provider_api_key."""
+        manager = create_config_manager(config_path=config_file)
+        providers = manager.get("registry", "providers")
+        assert "default" not in providers["openai"].api_keys
+
+        manager.set_provider_api_key("openai", "new-key")
+
+        providers = manager.get("registry", "providers")
+        assert providers["openai"].api_keys["default"]["key"] == "new-key"
+
+
+class TestSetProviderApiKey:
+    """Tests for ConfigManager.set_provider_api_key."""
+
+    def test_new_provider(self, config_file):
+        """Test setting a key for a provider that is not configured yet."""
+        manager = create_config_manager(config_path=config_file)
+        manager.set_provider_api_key("anthropic", "sk-ant")
+
+        provider = manager.get_config().get_provider("anthropic")
+        assert provider.api_keys["default"]["key"] == "sk-ant"
+        assert provider.__root_key__ == "anthropic"
+
+    def test_existing_provider_keeps_other_fields(self, config_file):
+        """Test that only the default key changes on an existing provider."""
+        manager = create_config_manager(config_path=config_file)
+        manager.set_provider_api_key("openai", "first")
+        manager.set_provider_api_key("openai", "second")
+
+        provider = manager.get_config().get_provider("openai")
+        assert provider.api_keys == {"default": {"key": "second"}}
+        assert provider.api_key == "key1"
+        assert provider.__root_key__ == "openai"
+
+
+class TestConfigManagerLookup:
+    """Tests for attribute resolution in ConfigManager.get."""
+
+    def test_extra_section_and_key(self, tmp_path):
+        """Test that extra (non-schema) sections and keys are reachable."""
+        path = tmp_path / "config.yaml"
+        path.write_text(
+            yaml.dump({"custom": {"flag": True}, "logging": {"format": "json"}})
+        )
+        manager = create_config_manager(config_path=str(path))
+
+        assert manager.get("custom", "missing", "fallback") == "fallback"
+        assert manager.get("logging", "format") == "json"
+        assert manager.get("logging", "level") == "INFO"
+
+    def test_model_values_are_returned_as_models(self, config_file):
+        """Test that get() returns the validated objects, not dumps."""
+        manager = create_config_manager(config_path=config_file)
+        config = manager.get_config()
+        providers = manager.get("registry", "providers")
+        assert providers["openai"] is config.registry.providers["openai"]
+
+
+class TestConfigManagerGetMany:
+    """Tests for ConfigManager.get_many."""
+
+    def test_get_many(self, config_file):
+        """Test that several values are returned with per-key defaults."""
+        manager = create_config_manager(config_path=config_file)
+        values = manager.get_many(
+            [("logging", "level"), ("registry", "auto_discover"), ("logging", "x")],
+            defaults={("logging", "x"): "fallback"},
+        )
+        assert values == {
+            ("logging", "level"): "DEBUG",
+            ("registry", "auto_discover"): False,
+            ("logging", "x"): "fallback",
+        }
+
+    def test_get_many_reads_one_snapshot(self, config_file):
+        """Test that a concurrent write cannot split a batch across snapshots."""
+        manager = create_config_manager(config_path=config_file)
+        snapshot = manager._snapshot
+
+        def specs():
+            yield ("logging", "level")
+            manager.set_provider_api_key("openai", "mid-batch")
+            yield ("registry", "providers")
+
+        values = manager.get_many(specs())
+        assert manager._snapshot is not snapshot
+        providers = values[("registry", "providers")]
+        assert "default" not in providers["openai"].api_keys
+
+
+class TestConfigManagerPath:
+    """Tests for config path normalization."""
+
+    def test_relative_path_is_anchored_at_construction(
+        self, config_file, monkeypatch, tmp_path
+    ):
+        """Test that reload() still finds a relative path after a chdir."""
+        monkeypatch.chdir(os.path.dirname(config_file))
+        manager = create_config_manager(config_path=os.path.basename(config_file))
+
+        other = tmp_path / "elsewhere"
+        other.mkdir()
+        monkeypatch.chdir(other)
+
+        assert manager.reload().logging.level == "DEBUG"
+
+    def test_symlink_is_followed_on_reload(self, config_file, tmp_path):
+        """Test that re-pointing a symlinked config is picked up."""
+        replacement = tmp_path / "replacement.yaml"
+        replacement.write_text(yaml.dump({"logging": {"level": "ERROR"}}))
+        link = tmp_path / "current.yaml"
+        link.symlink_to(config_file)
+        manager = create_config_manager(config_path=str(link))
+
+        link.unlink()
+        link.symlink_to(replacement)
+
+        assert manager.reload().logging.level == "ERROR"
+
+
+class TestConfigManagerLoad:
+    """Tests for ConfigManager.load."""
+
+    def test_load_does_not_take_the_lock(self, config_file):
+        """Test that load() proceeds while a writer holds the lock."""
+        manager = create_config_manager(config_path=config_file)
+        with manager._lock:
+            result = {}
+            thread = threading.Thread(
+                target=lambda: result.setdefault("config", manager.load())
+            )
+            thread.start()
+            thread.join(timeout=5)
+        assert result["config"].logging.level == "DEBUG"
+
+    def test_load_returns_caller_owned_config(self, config_file):
+        """Test that mutating load()'s result leaks into no manager."""
+        manager = create_config_manager(config_path=config_file)
+        assert manager.get("logging", "level") == "DEBUG"
+
+        config = manager.load()
+        config.logging.level = "ERROR"
+
+        assert manager.get("logging", "level") == "DEBUG"
+        assert manager.get_config().logging.level == "DEBUG"
+        other = create_config_manager(config_path=config_file)
+        assert other.get_config().logging.level == "DEBUG"
+
+    def test_load_leaves_shared_snapshot_unvalidated(self, config_file):
+        """Test that load() does not build the cached snapshot's full config."""
+        manager = create_config_manager(config_path=config_file)
+        assert manager.get("logging", "level") == "DEBUG"
+        snapshot = manager._snapshot
+
+        config = manager.load()
+
+        assert config.logging.level == "DEBUG"
+        assert snapshot._config is None
+        assert list(snapshot._values) == [("logging", "level")]
+        assert config is not manager.get_config()
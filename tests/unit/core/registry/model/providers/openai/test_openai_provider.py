@@ -3,6 +3,7 @@
 """
 
 import pytest
+from dataclasses import dataclass
 from typing import Any
 
 from ember.core.registry.model.providers.openai.openai_provider import (
@@ -28,14 +29,21 @@ class DummyChoice:
         self.message = DummyMessage(message_content)
 
 
+@dataclass(frozen=True)
+class DummyUsage:
+    total_tokens: int = 100
+    prompt_tokens: int = 40
+    completion_tokens: int = 60
+
+
+# Immutable, so every dummy response can share it.
+DUMMY_USAGE = DummyUsage()
+
+
 class DummyOpenAIResponse:
     def __init__(self) -> None:
         self.choices = [DummyChoice("Test response.")]
-        self.usage = type(
-            "Usage",
-            (),
-            {"total_tokens": 100, "prompt_tokens": 40, "completion_tokens": 60},
-        )
+        self.usage = DUMMY_USAGE
 
 
 def create_dummy_model_info() -> ModelInfo:
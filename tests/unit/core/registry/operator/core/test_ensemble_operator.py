@@ -1,4 +1,17 @@
+import dataclasses
+import threading
+import time
+
 import pytest
+
+from ember.core.registry.operator.core.ensemble import (
+    EnsembleOperator as RealEnsembleOperator,
+    EnsembleOperatorInputs as RealEnsembleOperatorInputs,
+)
+from ember.xcs.engine.execution_options import (
+    get_execution_options,
+    set_execution_options,
+)
 from tests.helpers.simplified_imports import EmberModel
 
 
@@ -99,3 +112,65 @@ def test_ensemble_operator_forward() -> None:
     assert (
         result["responses"] == expected_responses
     ), "Responses should match expected responses"
+
+
+def test_ensemble_operator_runs_models_concurrently() -> None:
+    """The real EnsembleOperator dispatches its LM calls concurrently, in order."""
+    # Each LM blocks until all of them are running; sequential dispatch would
+    # break the barrier.
+    barrier = threading.Barrier(3, timeout=5)
+
+    def make_lm(tag: str):
+        def lm(*, prompt: str) -> str:
+            barrier.wait()
+            return f"{tag}: {prompt}"
+
+        return lm
+
+    op = RealEnsembleOperator(lm_modules=[make_lm("a"), make_lm("b"), make_lm("c")])
+    result = op(inputs=RealEnsembleOperatorInputs(query="q"))
+
+    responses = result["responses"]
+    assert [response.split(":")[0] for response in responses] == ["a", "b", "c"]
+
+
+@pytest.fixture
+def restore_execution_options():
+    """Restore the global XCS execution options after the test."""
+    saved = get_execution_options()
+    yield set_execution_options
+    set_execution_options(**dataclasses.asdict(saved))
+
+
+def _peak_concurrency(num_units: int) -> int:
+    """Run the real EnsembleOperator and report the most overlapping LM calls."""
+    lock = threading.Lock()
+    state = {"active": 0, "peak": 0}
+
+    def lm(*, prompt: str) -> str:
+        with lock:
+            state["active"] += 1
+            state["peak"] = max(state["peak"], state["active"])
+        time.sleep(0.02)
+        with lock:
+            state["active"] -= 1
+        return prompt
+
+    op = RealEnsembleOperator(lm_modules=[lm] * num_units)
+    result = op(inputs=RealEnsembleOperatorInputs(query="q"))
+    assert len(result["responses"]) == num_units
+    return state["peak"]
+
+
+def test_ensemble_operator_sequential_when_parallel_disabled(
+    restore_execution_options,
+) -> None:
+    """With use_parallel=False the LM calls never overlap."""
+    restore_execution_options(use_parallel=False)
+    assert _peak_concurrency(4) == 1
+
+
+def test_ensemble_operator_respects_max_workers(restore_execution_options) -> None:
+    """max_workers caps the number of concurrent LM calls."""
+    restore_execution_options(max_workers=2)
+    assert _peak_concurrency(6) <= 2
@@ -2,6 +2,7 @@ from __future__ import annotations
 from typing import Dict, Type
 
 import pytest
+from pydantic import ValidationError
 from ember.core.types import EmberModel
 
 from ember.core.registry.specification.exceptions import (
@@ -55,6 +56,58 @@ def test_render_prompt_valid() -> None:
     assert rendered_prompt == "Hello, Test!"
 
 
+def test_render_prompt_with_model_input() -> None:
+    """Test that render_prompt accepts a model instance as input."""
+    dummy_specification: DummySpecification = DummySpecification()
+    rendered_prompt: str = dummy_specification.render_prompt(
+        inputs=DummyInput(name="Model")
+    )
+    assert rendered_prompt == "Hello, Model!"
+
+
+def test_render_prompt_attribute_placeholder() -> None:
+    """Test that attribute access within a placeholder still resolves."""
+
+    class NestedInput(EmberModel):
+        person: DummyInput
+
+    class NestedSpecification(Specification[NestedInput, DummyOutput]):
+        prompt_template: str = "Hello, {person[name]}!"
+        input_model: Type[NestedInput] = NestedInput
+        check_all_placeholders: bool = False
+
+    rendered_prompt: str = NestedSpecification().render_prompt(
+        inputs=NestedInput(person=DummyInput(name="Nested"))
+    )
+    assert rendered_prompt == "Hello, Nested!"
+
+
+def test_render_prompt_nested_format_spec_placeholder() -> None:
+    """Test that fields referenced inside a format spec are rendered."""
+
+    class PaddedInput(EmberModel):
+        x: str
+        width: int
+
+    class PaddedSpecification(Specification[PaddedInput, DummyOutput]):
+        prompt_template: str = "[{x:>{width}}]"
+        input_model: Type[PaddedInput] = PaddedInput
+        check_all_placeholders: bool = False
+
+    rendered_prompt: str = PaddedSpecification().render_prompt(
+        inputs=PaddedInput(x="a", width=5)
+    )
+    assert rendered_prompt == "[    a]"
+
+
+def test_specification_is_frozen() -> None:
+    """Test that specification fields cannot be reassigned after validation."""
+    dummy_specification: DummySpecification = DummySpecification()
+    with pytest.raises(ValidationError):
+        dummy_specification.prompt_template = "Bye, {name}!"
+    assert dummy_specification.prompt_template == "Hello, {name}!"
+
+
 def test_render_prompt_missing_placeholder() -> None:
     """Test that instantiation fails when a required placeholder is missing in the prompt template."""
 
@@ -0,0 +1,53 @@
+"""Tests for the operator composition example."""
+
+from unittest.mock import patch
+
+import pytest
+
+from ember.core.registry.model.model_module.lm import LMModule
+from ember.examples.operators.composition_example import QuestionRefinement
+
+MODEL_NAME = "openai:gpt-4o-mini"
+
+
+@pytest.fixture
+def lm_calls():
+    """Replace LM calls with a stub and record the prompts they receive."""
+    prompts = []
+
+    def fake_call(self, *, prompt, **kwargs):
+        prompts.append(prompt)
+        return f"refined {len(prompts)}"
+
+    QuestionRefinement.clear_cache()
+    with patch.object(LMModule, "__init__", lambda self, **kwargs: None), patch.object(
+        LMModule, "__call__", fake_call
+    ):
+        yield prompts
+    QuestionRefinement.clear_cache()
+
+
+def test_repeated_query_hits_cache(lm_calls) -> None:
+    """Refining the same query twice, even across instances, calls the LM once."""
+    first = QuestionRefinement(model_name=MODEL_NAME)
+    second = QuestionRefinement(model_name=MODEL_NAME)
+
+    result = first(inputs={"query": "What is gravity?"})
+    cached = second(inputs={"query": "What is gravity?"})
+
+    assert len(lm_calls) == 1
+    assert cached.refined_query == result.refined_query == "refined 1"
+
+
+def test_clear_cache_forces_new_call(lm_calls) -> None:
+    """clear_cache() drops cached refinements."""
+    refiner = QuestionRefinement(model_name=MODEL_NAME)
+    refiner(inputs={"query": "What is gravity?"})
+    assert QuestionRefinement._cache
+
+    QuestionRefinement.clear_cache()
+    assert not QuestionRefinement._cache
+
+    result = refiner(inputs={"query": "What is gravity?"})
+    assert len(lm_calls) == 2
+    assert result.refined_query == "refined 2"
@@ -7,7 +7,7 @@ and execution using a mock operator.
 from typing import Any, Dict
 
 # Use stub classes for testing to avoid import cycle issues
-from tests.helpers.stub_classes import Operator
+from tests.helpers.stub_classes import DUMMY_SPECIFICATION, Operator
 from ember.xcs.tracer.xcs_tracing import TracerContext
 from ember.xcs.tracer.tracer_decorator import jit
 
@@ -22,16 +22,7 @@ class MockOperator(Operator[Dict[str, Any], Dict[str, Any]]):
     """
 
     # For testing, we use a simplified specification.
-    specification = type(
-        "DummySpecification",
-        (),
-        {
-            "input_model": dict,
-            "validate_inputs": lambda self, *, inputs: inputs,
-            "validate_output": lambda self, *, output: output,
-            "render_prompt": lambda self, *, inputs: "dummy prompt",
-        },
-    )()
+    specification = DUMMY_SPECIFICATION
 
     def forward(self, *, inputs: Dict[str, Any]) -> Dict[str, Any]:
         """Executes the operator, doubling the input 'value'.
@@ -8,7 +8,7 @@ from typing import Any, Dict
 import pytest
 from pydantic import BaseModel
 
-from tests.helpers.stub_classes import Operator
+from tests.helpers.stub_classes import Operator, PassthroughSpecification
 from ember.xcs.tracer.xcs_tracing import TracerContext
 from ember.xcs.tracer.tracer_decorator import jit
 
@@ -24,16 +24,7 @@ class MockOperator(Operator[MockInput, Dict[str, Any]]):
     """A mock operator that doubles the input value."""
 
     # For testing, we use a simplified specification.
-    specification = type(
-        "DummySpecification",
-        (),
-        {
-            "input_model": MockInput,
-            "validate_inputs": lambda self, *, inputs: inputs,
-            "validate_output": lambda self, *, output: output,
-            "render_prompt": lambda self, *, inputs: "dummy prompt",
-        },
-    )()
+    specification = PassthroughSpecification(input_model=MockInput)
 
     def forward(self, *, inputs: Any) -> Dict[str, Any]:
         # Allow inputs to be passed as either a dict or a MockInput instance.